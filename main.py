@@ -5,35 +5,75 @@ import math
 import json
 import os
 import re
+import hashlib
+import threading
+import collections
+import functools
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pyautogui
+try:
+    import numpy as np
+except ImportError:  # optional — per-block timing falls back to pure Python
+    np = None
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QLabel, QSlider, QPushButton, QFrame, QProgressBar,
+    QTextEdit, QPlainTextEdit, QLabel, QSlider, QPushButton, QFrame, QProgressBar,
     QCheckBox, QScrollArea, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QObject, QTimer, QSignalBlocker,
+    QThreadPool, QRunnable, QMetaObject, Q_ARG
+)
+from PyQt6.QtGui import QFont, QTextCursor
 
 SETTINGS_FILE = "typer_settings.json"
+FS_CACHE_FILE = "typer_fs_cache.json"
+FS_CACHE_MAX  = 500
+
+_SENT_END_RE = re.compile(r'[.!?]\s')
+_WORD_RE     = re.compile(r'\S+')
+# strong (keyword/comment) and weak (control-flow) code-line prefixes
+_STRONG_PREFIXES = ('import ', 'def ', 'class ', '#!', '//', '/*', '*/', 'package ', 'using ')
+_WEAK_PREFIXES   = ('if ', 'elif ', 'else:', 'for ', 'while ', 'return ', 'try:', 'except ',
+                    'finally:', 'with ')
+_BLOCK_PREFIXES  = ('def ', 'class ', 'async def ')
+_CODE_SUFFIXES   = ('{', '}', ');', '};', ':')
+# key class per ASCII code for the typing loop:
+# 0 other, 1 clause punctuation, 2 sentence punctuation, 3 space/tab, 4 newline
+_KEY_CLASS = bytes(1 if c in ',;:' else 2 if c in '.!?' else 3 if c in ' \t' else
+                   4 if c == '\n' else 0 for c in map(chr, range(128)))
 
 
 # ─────────────────────────────────────────────── text helpers
+def _is_import(stripped):
+    # same as re.match(r'^(import |from .+ import )', stripped) on a single line
+    return stripped.startswith('import ') or (
+        stripped.startswith('from ') and stripped.find(' import ', 6) != -1)
+
+
 def detect_text_type(text):
     code_indicators = 0
     lines = text.split('\n')
     total_lines = max(len(lines), 1)
+    remaining = len(lines)
     for line in lines:
         stripped = line.strip()
-        if re.match(r'^(import |from .+ import |def |class |#!|//|/\*|\*/|package |using )', stripped):
+        if stripped.startswith(_STRONG_PREFIXES) or _is_import(stripped):
             code_indicators += 2
-        elif re.match(r'^(if |elif |else:|for |while |return |try:|except |finally:|with )', stripped):
+        elif stripped.startswith(_WEAK_PREFIXES):
             code_indicators += 1
-        elif stripped.endswith(('{', '}', ');', '};', ':')) and not stripped.endswith('.:'):
+        elif stripped.endswith(_CODE_SUFFIXES) and not stripped.endswith('.:'):
             code_indicators += 1
         elif re.match(r'^\s', line) and stripped and not stripped[0].isupper():
             code_indicators += 0.5
+        # the score only grows, by at most 2 per line — stop once the verdict is fixed
+        remaining -= 1
+        if code_indicators / total_lines > 0.15:
+            return "code"
+        if (code_indicators + 2 * remaining) / total_lines <= 0.15:
+            return "prose"
     return "code" if (code_indicators / total_lines) > 0.15 else "prose"
 
 
@@ -55,11 +95,11 @@ def split_into_blocks(text):
         line, stripped = lines[i], lines[i].strip()
         is_boundary = False
         if current_block:
-            if re.match(r'^(def |class |async def )', stripped):
+            if stripped.startswith(_BLOCK_PREFIXES):
                 is_boundary = True
-            elif re.match(r'^(import |from .+ import )', stripped):
+            elif _is_import(stripped):
                 prev = current_block[-1].strip()
-                if prev and not re.match(r'^(import |from .+ import |#)', prev):
+                if prev and not (_is_import(prev) or prev.startswith('#')):
                     is_boundary = True
             elif stripped == '' and current_block and current_block[-1].strip() == '':
                 while i < len(lines) and lines[i].strip() == '':
@@ -73,37 +113,92 @@ def split_into_blocks(text):
     return blocks if blocks else [text]
 
 
+def _sample_boundaries(text, k_fs, k_ed, rng=random):
+    # One pass over sentence ends, feeding two Algorithm R reservoirs: false
+    # starts need 60 chars of tail, edits 40. Edits must avoid the false-start
+    # spots, so their reservoir holds k_fs extra and those picks are dropped.
+    total = len(text)
+    fs, ed, n_fs, n_ed, k_pool = [], [], 0, 0, k_fs + k_ed
+    for m in _SENT_END_RE.finditer(text):
+        p = m.end()
+        if p <= 80: continue
+        if k_fs and p < total - 60:
+            n_fs += 1
+            if len(fs) < k_fs: fs.append(p)
+            else:
+                j = rng.randrange(n_fs)
+                if j < k_fs: fs[j] = p
+        if k_ed and p < total - 40:
+            n_ed += 1
+            if len(ed) < k_pool: ed.append(p)
+            else:
+                j = rng.randrange(n_ed)
+                if j < k_pool: ed[j] = p
+    fs = set(fs)
+    ed = [p for p in ed if p not in fs]
+    return fs, set(rng.sample(ed, min(k_ed, len(ed))))
+
+
 OLLAMA_BASE_URL = "http://localhost:11434"
 
+# last /api/tags probe, shared by every check worker; reused for OLLAMA_CACHE_TTL s
+OLLAMA_CACHE_TTL = 30
+_OLLAMA_CACHE = {"url": None, "t": 0.0, "ok": False, "msg": ""}
+
 
 # ─────────────────────────────────────────────── workers
-class OllamaCheckWorker(QObject):
-    result = pyqtSignal(bool, str)
-    finished = pyqtSignal()
+class SettingsSaveTask(QRunnable):
+    # writes to a temp file and renames it over the settings, so a crash
+    # mid-write never leaves a torn file; reports back via a queued slot call
+    def __init__(self, data, target):
+        super().__init__()
+        self.data, self.target = data, target
 
     def run(self):
+        tmp = SETTINGS_FILE + ".tmp"
+        try:
+            with open(tmp, "w") as f: json.dump(self.data, f)
+            os.replace(tmp, SETTINGS_FILE)
+        except Exception:
+            return
+        QMetaObject.invokeMethod(self.target, "_on_save_done", Qt.ConnectionType.QueuedConnection)
+
+
+class OllamaCheckTask(QRunnable):
+    # runs on a pooled thread; the verdict goes back via a queued slot call
+    def __init__(self, target, force=False):
+        super().__init__()
+        self.target, self.force = target, force
+
+    def run(self):
+        c = _OLLAMA_CACHE
+        if (self.force or c["url"] != OLLAMA_BASE_URL
+                or time.monotonic() - c["t"] >= OLLAMA_CACHE_TTL):
+            ok, msg = self._probe()
+            c.update(url=OLLAMA_BASE_URL, t=time.monotonic(), ok=ok, msg=msg)
+        QMetaObject.invokeMethod(self.target, "_on_ollama_result", Qt.ConnectionType.QueuedConnection,
+                                 Q_ARG(bool, c["ok"]), Q_ARG(str, c["msg"]))
+
+    def _probe(self):
         try:
             req = urllib.request.Request(f"{OLLAMA_BASE_URL}/api/tags", method="GET")
-            with urllib.request.urlopen(req, timeout=3) as resp:
-                if resp.status == 200:
-                    data = json.loads(resp.read())
-                    models = [m["name"] for m in data.get("models", [])]
-                    if models:
-                        self.result.emit(True, f"Connected — {len(models)} model(s)")
-                    else:
-                        self.result.emit(False, "Ollama running but no models installed")
-                else:
-                    self.result.emit(False, "Ollama returned unexpected status")
+            with urllib.request.urlopen(req, timeout=2) as resp:
+                if resp.status != 200:
+                    return False, "Ollama returned unexpected status"
+                data = json.loads(resp.read())
+                models = [m["name"] for m in data.get("models", [])]
+                if models:
+                    return True, f"Connected — {len(models)} model(s)"
+                return False, "Ollama running but no models installed"
         except (urllib.error.URLError, OSError):
-            self.result.emit(False, "Ollama not detected")
+            return False, "Ollama not detected"
         except Exception as e:
-            self.result.emit(False, f"Error: {str(e)}")
-        finally:
-            self.finished.emit()
+            return False, f"Error: {str(e)}"
 
 
 class TypingWorker(QObject):
-    text_updated     = pyqtSignal(str)
+    text_updated     = pyqtSignal(str, int)   # (text from index onward, index) — rewrites
+    text_appended    = pyqtSignal(str)        # characters added after the last emission
     progress_updated = pyqtSignal(int)
     countdown_updated= pyqtSignal(int)
     status_message   = pyqtSignal(str)
@@ -126,8 +221,18 @@ class TypingWorker(QObject):
         self.false_start_count = 3
         self.mistake_discovery_enabled = True
         self.edit_frequency = 3
-        self._stop_requested = False
-        self._pause_requested = False
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event(); self._resume_event.set()  # clear while paused
+        self._wake = threading.Event()   # nudges _responsive_sleep on any control change
+        self._emit_t = 0.0
+        self._dirty_from = 0
+        self._emit_len = 0     # len(typed) at the last emission
+        self._rng = random.Random()   # private generator — no shared module state
+        self._np_rng = None           # numpy generator, seeded from _rng per run
+        self._tail = collections.deque(maxlen=self._EDIT_LOOKBACK)  # == typed[-500:], for edits
+        self._io = None        # single-thread executor for keystrokes, per run
+        self._io_last = None
+        self._unsent = 0       # keys of a run abandoned on the I/O thread at stop
         self._thinking_messages = [
             "Thinking...", "Collecting thoughts...", "Composing...",
             "Considering phrasing...", "Reviewing...", "Reflecting...",
@@ -139,25 +244,158 @@ class TypingWorker(QObject):
             'q':'wa','r':'edft','s':'awedzx','t':'rfgy','u':'yhjkio',
             'v':'cfgb','w':'qase','x':'zsdc','y':'tghu','z':'asx',' ':'cvbnm',
         }
+        self._cache_timing()
 
-    def stop(self): self._stop_requested = True
-    def pause(self): self._pause_requested = True
-    def resume(self): self._pause_requested = False
+    def stop(self): self._stop_event.set(); self._resume_event.set(); self._wake.set()
+    def pause(self): self._resume_event.clear(); self._wake.set()
+    def resume(self): self._resume_event.set(); self._wake.set()
+    def is_paused(self): return not self._resume_event.is_set()
+
+    def _cache_timing(self):
+        # settings are fixed for the length of a run — derive the delay terms once
+        self._base      = 60 / (self.wpm * 5)
+        self._var_amp   = 2 * (self.variability / 100) * self._base
+        self._burst_amp = (self.burstiness / 100) * self._base
 
     def get_delay(self, index):
-        base = 60 / (self.wpm * 5)
-        jitter = (random.random() - 0.5) * 2 * (self.variability / 100) * base
-        burst  = math.sin(index / 5) * (self.burstiness / 100) * base
-        return max(0.005, base + jitter + burst)
+        return max(0.005, self._base + (self._rng.random() - 0.5) * self._var_amp
+                   + math.sin(index / 5) * self._burst_amp)
+
+    def _block_timing(self, n, start):
+        # base delays and typo decisions for the next n keystrokes, drawn in one
+        # batch per block; index i matches get_delay(start + i)
+        base, var_amp, burst_amp = self._base, self._var_amp, self._burst_amp
+        rng = self._np_rng
+        if rng is not None:
+            delays = np.maximum(0.005, base + (rng.random(n) - 0.5) * var_amp
+                                + np.sin(np.arange(start, start + n) / 5) * burst_amp)
+            typos = rng.random(n) * 100 < self.error_rate
+            return delays.tolist(), typos.tolist()
+        rand = self._rng.random
+        delays = [max(0.005, base + (rand() - 0.5) * var_amp + math.sin(i / 5) * burst_amp)
+                  for i in range(start, start + n)]
+        typos = [rand() * 100 < self.error_rate for _ in range(n)]
+        return delays, typos
+
+    _WRITE_CHUNK = 8
+
+    def _send(self, fn, *args, **kwargs):
+        # Keystrokes run on the I/O thread so the next delay/typo decision (or
+        # sleep) overlaps the OS call. Waiting on the previous key first keeps
+        # them ordered and re-raises FailSafeException on this thread.
+        self._io_wait()
+        self._io_last = self._io.submit(fn, *args, **kwargs)
+
+    def _io_wait(self):
+        if self._io_last is not None:
+            last, self._io_last = self._io_last, None
+            last.result()
+
+    def _type_run(self, run, delays):
+        # Runs on the I/O thread: each key keeps its own precomputed delay, and
+        # pause/stop are honoured between keys rather than after the whole run.
+        write, sleep = pyautogui.write, time.sleep
+        stopped, resumed = self._stop_event.is_set, self._resume_event
+        for i, (ch, d) in enumerate(zip(run, delays)):
+            if not resumed.is_set(): resumed.wait()
+            if stopped(): self._unsent += len(run) - i; return
+            write(ch)
+            if d: sleep(d)
+
+    def _flush(self, pending, pend_d, typed, wait=True):
+        # One I/O job per run of ordinary keys, each followed by its own delay.
+        # wait=False leaves the run typing in the background; callers about to
+        # pause must wait so the pause starts after the run's last key. After a
+        # stop nothing more is sent; run() drops the leftover from typed.
+        if pending and not self._stop_event.is_set():
+            self._send(self._type_run, ''.join(pending), pend_d[:])
+            self._emit_text(typed, force=pending[-1] in '.!?\n')
+            pending.clear(); pend_d.clear()
+            if wait: self._io_wait()
+
+    _EMIT_INTERVAL = 1 / 30
+
+    def _emit_text(self, typed, force=False):
+        # Send only what changed since the last emission, at most ~30 times a
+        # second; _dirty_from is the lowest index touched since then. Pure
+        # growth goes out as an append, anything else as a rewrite from start.
+        now = time.monotonic()
+        if not force and now - self._emit_t < self._EMIT_INTERVAL: return
+        start = min(self._dirty_from, len(typed))
+        if start == self._emit_len:
+            if start < len(typed): self.text_appended.emit(''.join(typed[start:]))
+        else:
+            self.text_updated.emit(''.join(typed[start:]), start)
+        self._emit_t, self._dirty_from = now, len(typed)
+        self._emit_len = len(typed)
+
+    def _mark_dirty(self, index):
+        self._dirty_from = min(self._dirty_from, index)
 
     def _responsive_sleep(self, duration):
-        end = time.time() + duration
-        while time.time() < end and not self._stop_requested:
-            if self._pause_requested:
-                time.sleep(0.1)
-                end += 0.1  # extend deadline while paused
-            else:
-                time.sleep(0.2)
+        # sleeps until the time is up or stop is requested; paused time doesn't count
+        remaining = duration
+        while remaining > 0 and not self._stop_event.is_set():
+            if not self._resume_event.is_set():
+                self._resume_event.wait(); continue
+            t = time.monotonic()
+            self._wake.wait(remaining); self._wake.clear()
+            remaining -= time.monotonic() - t
+
+    # generated fragments keyed by model + context tail, shared across runs
+    _FS_CACHE = {}
+    _fs_cache_loaded = False
+
+    @staticmethod
+    def _fs_key(model, ctx):
+        return hashlib.sha1(f"{model}|{ctx[-200:]}".encode()).hexdigest()
+
+    @classmethod
+    def _load_fs_cache(cls):
+        if cls._fs_cache_loaded: return
+        cls._fs_cache_loaded = True
+        try:
+            with open(FS_CACHE_FILE) as f: cls._FS_CACHE.update(json.load(f))
+        except Exception:
+            pass
+
+    @classmethod
+    def _store_fs(cls, key, fragment):
+        cls._FS_CACHE[key] = fragment
+        while len(cls._FS_CACHE) > FS_CACHE_MAX:
+            del cls._FS_CACHE[next(iter(cls._FS_CACHE))]
+        tmp = FS_CACHE_FILE + ".tmp"   # never leave a half-written cache behind
+        try:
+            with open(tmp, "w") as f: json.dump(cls._FS_CACHE, f)
+            os.replace(tmp, FS_CACHE_FILE)
+        except Exception:
+            pass
+
+    _fs_models = ("llama3.2:3b", "phi3")
+
+    def _request_fragment(self, model, prompt):
+        try:
+            payload = json.dumps({
+                "model": model, "prompt": prompt, "stream": True,
+                "options": {"temperature": 0.9, "num_predict": 35},
+            }).encode()
+            req = urllib.request.Request(
+                f"{OLLAMA_BASE_URL}/api/generate", data=payload,
+                headers={"Content-Type": "application/json"}, method="POST",
+            )
+            # stop reading once the first line is done; closing the stream stops generation
+            fragment = ""
+            with urllib.request.urlopen(req, timeout=15) as resp:
+                for line in resp:
+                    if not line.strip(): continue
+                    chunk = json.loads(line)
+                    fragment += chunk.get("response", "")
+                    if chunk.get("done") or '\n' in fragment.lstrip() \
+                            or len(fragment.split()) >= 20:
+                        break
+            return fragment.strip().split('\n')[0].strip().strip('"\'') or None
+        except Exception:
+            return None
 
     def _generate_false_start(self, context):
         prompt = (
@@ -166,42 +404,40 @@ class TypingWorker(QObject):
             "Match the writing style. Output only the fragment, nothing else.\n\n"
             f"Context: {context}"
         )
-        for model in ("llama3.2:3b", "phi3"):
-            try:
-                payload = json.dumps({
-                    "model": model, "prompt": prompt, "stream": False,
-                    "options": {"temperature": 0.9, "num_predict": 35},
-                }).encode()
-                req = urllib.request.Request(
-                    f"{OLLAMA_BASE_URL}/api/generate", data=payload,
-                    headers={"Content-Type": "application/json"}, method="POST",
-                )
-                with urllib.request.urlopen(req, timeout=15) as resp:
-                    fragment = json.loads(resp.read()).get("response","").strip()
-                    fragment = fragment.split('\n')[0].strip().strip('"\'')
-                    if fragment: return fragment
-            except Exception:
-                continue
+        for model in self._fs_models:
+            key = self._fs_key(model, context)
+            if key in self._FS_CACHE: return self._FS_CACHE[key]
+        # ask every model at once and take the first usable answer, so a cold or
+        # missing model no longer costs a full timeout before the next is tried
+        pool = ThreadPoolExecutor(max_workers=len(self._fs_models))
+        futures = {pool.submit(self._request_fragment, m, prompt): m for m in self._fs_models}
+        try:
+            for fut in as_completed(futures):
+                fragment = fut.result()
+                if fragment:
+                    self._store_fs(self._fs_key(futures[fut], context), fragment)
+                    return fragment
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
         return None
 
-    def _perform_false_start(self, typed_content, bcd):
-        ctx = typed_content[-random.randint(150,250):] if len(typed_content)>150 else typed_content
+    def _perform_false_start(self, typed, bcd):
+        ctx = ''.join(typed[-self._rng.randint(150,250):])
         fragment = self._generate_false_start(ctx)
-        if not fragment or self._stop_requested: return typed_content
+        if not fragment or self._stop_event.is_set(): return
         self.status_message.emit("Reconsidering...")
         for ch in fragment:
-            if self._stop_requested: return typed_content
-            pyautogui.write(ch); typed_content += ch
-            self.text_updated.emit(typed_content)
-            time.sleep(self.get_delay(0) * random.uniform(0.8, 1.2))
-        time.sleep(random.uniform(0.7, 2.0))
+            if self._stop_event.is_set(): return
+            self._send(pyautogui.write, ch); typed.append(ch); self._tail.append(ch)
+            self._emit_text(typed)
+            time.sleep(self.get_delay(0) * self._rng.uniform(0.8, 1.2))
+        time.sleep(self._rng.uniform(0.7, 2.0))
         for _ in range(len(fragment)):
-            if self._stop_requested: return typed_content
-            pyautogui.press('backspace'); typed_content = typed_content[:-1]
-            self.text_updated.emit(typed_content)
-            time.sleep(bcd * random.uniform(0.3, 0.7))
-        time.sleep(random.uniform(0.5, 1.2))
-        return typed_content
+            if self._stop_event.is_set(): return
+            self._send(pyautogui.press, 'backspace'); self._pop_typed(typed)
+            self._mark_dirty(len(typed)); self._emit_text(typed)
+            time.sleep(bcd * self._rng.uniform(0.3, 0.7))
+        time.sleep(self._rng.uniform(0.5, 1.2))
 
     _edit_replacements = [
         ("very","quite"),("good","solid"),("bad","poor"),("big","large"),
@@ -215,65 +451,100 @@ class TypingWorker(QObject):
         ("probelm","problem"),("teh","the"),("wiht","with"),("becuase","because"),
         ("recieve","receive"),("acheive","achieve"),("occured","occurred"),("seperate","separate"),
     ]
-
-    def _find_editable_word(self, typed_content):
-        # Search directly in the last ~500 chars of typed_content so distance
+    # one alternation over every candidate word, compiled once at class load;
+    # group i+1 is pair i, so the replacement is found by m.lastindex rather
+    # than by lower() — re.I folding (e.g. 'ſ' ~ 's') differs from str.lower()
+    _EDIT_RE    = re.compile(
+        r'\b(?:' + '|'.join(f'({re.escape(old)})' for old, _ in _edit_replacements) + r')\b', re.I)
+    _EDIT_NEW   = tuple(new for _, new in _edit_replacements)
+
+    _EDIT_LOOKBACK = 500
+
+    def _pop_typed(self, typed):
+        # a full deque dropped its oldest char on append; put it back on a
+        # backspace so _tail stays exactly typed[-_EDIT_LOOKBACK:]
+        typed.pop(); tail = self._tail; tail.pop()
+        if len(typed) > len(tail): tail.appendleft(typed[-len(tail) - 1])
+
+    def _find_editable_word(self, typed):
+        # Search directly in the last ~500 typed chars so distance
         # calculations are always accurate (no sentence-reconstruction mismatch).
-        lookback = 500
-        region_start = max(0, len(typed_content) - lookback)
-        region = typed_content[region_start:]
+        # _tail mirrors that suffix of typed, so no slice of typed is taken here.
+        region = ''.join(self._tail)
+        region_start = len(typed) - len(region)
         if len(region) < 20:
             return None
-        pairs = list(self._edit_replacements); random.shuffle(pairs)
-        for old, new in pairs:
-            matches = list(re.finditer(r'\b' + re.escape(old) + r'\b', region, re.I))
-            if matches:
-                m = random.choice(matches)
-                # distance from the start of the matched word to end of typed_content
-                abs_pos = region_start + m.start()
-                dist_from_end = len(typed_content) - abs_pos
-                rep = (new[0].upper() + new[1:]) if m.group()[0].isupper() else new
-                return (dist_from_end, m.group(), rep)
-        return None
+        matches = list(self._EDIT_RE.finditer(region))
+        if not matches:
+            return None
+        m = self._rng.choice(matches)
+        new = self._EDIT_NEW[m.lastindex - 1]
+        # distance from the start of the matched word to end of the typed text
+        abs_pos = region_start + m.start()
+        dist_from_end = len(typed) - abs_pos
+        rep = (new[0].upper() + new[1:]) if m.group()[0].isupper() else new
+        return (dist_from_end, m.group(), rep)
+
+    @staticmethod
+    def _shift_press(key, presses, interval):
+        pyautogui.keyDown('shift')
+        try:
+            pyautogui.press(key, presses=presses, interval=interval)
+        finally:
+            pyautogui.keyUp('shift')
 
-    def _perform_mistake_discovery(self, typed_content, bcd):
-        result = self._find_editable_word(typed_content)
-        if not result or self._stop_requested: return typed_content
+    def _perform_mistake_discovery(self, typed, bcd):
+        result = self._find_editable_word(typed)
+        if not result or self._stop_event.is_set(): return
         dist, old_word, new_word = result
         self.status_message.emit("Fixing mistake...")
-        time.sleep(random.uniform(1.0, 2.5))
-        if self._stop_requested: return typed_content
-        for _ in range(dist):
-            if self._stop_requested: return typed_content
-            pyautogui.press('left'); time.sleep(bcd * random.uniform(0.15, 0.35))
-        for _ in range(len(old_word)):
-            if self._stop_requested: return typed_content
-            pyautogui.hotkey('shift','right'); time.sleep(bcd * random.uniform(0.15, 0.35))
-        pyautogui.press('delete'); time.sleep(bcd * random.uniform(0.5, 1.0))
+        time.sleep(self._rng.uniform(1.0, 2.5))
+        if self._stop_event.is_set(): return
+        # Arrow keys go out in short bursts (one call, per-burst pace) rather than
+        # Ctrl+Arrow word jumps, whose stops around punctuation and trailing
+        # spaces differ between editors and would misplace the edit.
+        moved = 0
+        while moved < dist:
+            if self._stop_event.is_set(): return
+            n = min(dist - moved, self._rng.randint(4, 8))
+            self._send(pyautogui.press, 'left', presses=n,
+                       interval=bcd * self._rng.uniform(0.15, 0.35))
+            moved += n
+        if self._stop_event.is_set(): return
+        self._send(self._shift_press, 'right', len(old_word),
+                   bcd * self._rng.uniform(0.15, 0.35))
+        self._send(pyautogui.press, 'delete'); time.sleep(bcd * self._rng.uniform(0.5, 1.0))
         for ch in new_word:
-            if self._stop_requested: return typed_content
-            pyautogui.write(ch); time.sleep(self.get_delay(0) * random.uniform(0.8, 1.2))
-        ep = len(typed_content) - dist
-        typed_content = typed_content[:ep] + new_word + typed_content[ep+len(old_word):]
-        self.text_updated.emit(typed_content)
-        time.sleep(bcd * random.uniform(0.3, 0.6))
-        pyautogui.press('end'); pyautogui.hotkey('ctrl','end')
-        time.sleep(random.uniform(0.3, 0.7))
-        return typed_content
-
-    _abbreviations = {
+            if self._stop_event.is_set(): return
+            self._send(pyautogui.write, ch); time.sleep(self.get_delay(0) * self._rng.uniform(0.8, 1.2))
+        ep = len(typed) - dist
+        typed[ep:ep+len(old_word)] = new_word
+        self._tail.clear(); self._tail.extend(typed[-self._EDIT_LOOKBACK:])
+        self._mark_dirty(ep); self._emit_text(typed, force=True)
+        time.sleep(bcd * self._rng.uniform(0.3, 0.6))
+        self._send(pyautogui.press, 'end'); self._send(pyautogui.hotkey, 'ctrl', 'end')
+        time.sleep(self._rng.uniform(0.3, 0.7))
+
+    _abbreviations = frozenset({
         "mr","mrs","ms","dr","prof","sr","jr","st","ave","blvd","dept","est",
         "govt","inc","corp","ltd","co","vs","etc","approx","assn","div","gen",
         "gov","hon","fig","eq","vol","no","op","ed","rev","al","e.g","i.e",
-    }
-
-    def _is_sentence_end(self, block, i):
+    })
+
+    @staticmethod
+    def _word_starts(block):
+        # word_start[i] is where the alphabetic run ending just before i begins
+        word_start, last = [0]*len(block), 0
+        for i, c in enumerate(block):
+            word_start[i] = last
+            if not c.isalpha(): last = i+1
+        return word_start
+
+    def _is_sentence_end(self, block, i, word_start):
         char = block[i]
         if char not in '.!?': return False
         if char in '!?': return True
-        ws = i-1
-        while ws >= 0 and block[ws].isalpha(): ws -= 1
-        word = block[ws+1:i].lower()
+        word = block[word_start[i]:i].lower()
         if word in self._abbreviations or (len(word)==1 and word.isalpha()): return False
         if i > 0 and block[i-1] == '.': return False
         j = i+1
@@ -283,13 +554,13 @@ class TypingWorker(QObject):
 
     def _get_block_pause(self, next_block):
         if not self.smart_pausing:
-            return self.block_pause + random.uniform(-self.block_pause*0.3, self.block_pause*0.3)
+            return self.block_pause + self._rng.uniform(-self.block_pause*0.3, self.block_pause*0.3)
         n = len(next_block.strip())
-        base = random.uniform(3,6) if n<100 else (random.uniform(6,12) if n<=300 else random.uniform(12,25))
-        return base + random.uniform(-base*0.3, base*0.3)
+        base = self._rng.uniform(3,6) if n<100 else (self._rng.uniform(6,12) if n<=300 else self._rng.uniform(12,25))
+        return base + self._rng.uniform(-base*0.3, base*0.3)
 
     def _emit_stats(self, chars_typed, total_chars, total_blocks, block_idx, fs_done, ed_done, t0):
-        elapsed = time.time() - t0
+        elapsed = time.monotonic() - t0
         wpm = (chars_typed/5)/(elapsed/60) if elapsed>0 and chars_typed>0 else 0
         eta = ((total_chars-chars_typed)/5)/(wpm/60) if wpm>0 else 0
         self.stats_updated.emit({
@@ -299,125 +570,159 @@ class TypingWorker(QObject):
             "false_starts": fs_done, "corrections": ed_done,
         })
 
+    @pyqtSlot(dict)
+    def configure(self, cfg):
+        # run settings arrive as one queued call, applied on the worker thread
+        self.__dict__.update(cfg)
+
+    @pyqtSlot()
     def run(self):
+        rand, uniform, randint, choice = (
+            self._rng.random, self._rng.uniform, self._rng.randint, self._rng.choice)
         try:
-            self._stop_requested = False
+            self._stop_event.clear()
+            self._emit_t, self._dirty_from, self._emit_len = 0.0, 0, 0
+            self._tail.clear()
+            if np is not None:
+                self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
             pyautogui.PAUSE = 0.0
+            self._io, self._io_last = ThreadPoolExecutor(max_workers=1), None
+            self._unsent = 0
+            if self.false_starts_enabled:
+                self._load_fs_cache()  # on the worker thread, warm before the countdown ends
             blocks      = split_into_blocks(self.source_text)
             total_blocks= len(blocks)
             total_chars = len(self.source_text)
-            bcd         = 60 / (self.wpm * 5)
+            self._cache_timing()
+            bcd         = self._base
 
             self.phase_changed.emit("countdown")
             self.status_message.emit("Switch to your target window…")
             for i in range(self.start_delay, 0, -1):
-                if self._stop_requested:
+                if self._stop_event.is_set():
                     self.phase_changed.emit("stopped"); self.finished.emit(); return
-                self.countdown_updated.emit(i); time.sleep(1)
+                self.countdown_updated.emit(i); self._stop_event.wait(1)
             self.countdown_updated.emit(0)
             self.phase_changed.emit("typing")
 
-            typed_content = ""
+            typed         = []   # typed chars; joined only for emitted suffixes
             chars_typed   = 0
             chars_micro   = 0
-            micro_thresh  = random.randint(60, 100)
+            micro_thresh  = randint(60, 100)
 
             # Both false starts and edits fire only at sentence boundaries so
             # they never interrupt mid-sentence.
-            sentence_ends = [m.end() for m in re.finditer(r'[.!?]\s', self.source_text)]
-
-            fs_triggers = set()
-            if self.false_starts_enabled and self.false_start_count>0 and total_chars>200:
-                eligible_fs = [p for p in sentence_ends if 80 < p < total_chars - 60]
-                if eligible_fs:
-                    fs_triggers = set(random.sample(
-                        eligible_fs, min(self.false_start_count, len(eligible_fs))))
+            k_fs = self.false_start_count if self.false_starts_enabled and total_chars>200 else 0
+            k_ed = self.edit_frequency if self.mistake_discovery_enabled and total_chars>200 else 0
+            fs_triggers, ed_triggers = _sample_boundaries(self.source_text, k_fs, k_ed, self._rng)
             fs_rem, fs_done = len(fs_triggers), 0
-
-            ed_triggers = set()
-            if self.mistake_discovery_enabled and self.edit_frequency>0 and total_chars>200:
-                eligible_ed = [p for p in sentence_ends
-                               if 80 < p < total_chars - 40 and p not in fs_triggers]
-                if eligible_ed:
-                    ed_triggers = set(random.sample(
-                        eligible_ed, min(self.edit_frequency, len(eligible_ed))))
             ed_rem, ed_done = len(ed_triggers), 0
-            t0 = time.time()
+            pending, pend_d = [], []
+            t0 = time.monotonic()
+
+            # hot-loop lookups, bound once
+            stopped, resumed = self._stop_event.is_set, self._resume_event
+            flush, send, emit_text = self._flush, self._send, self._emit_text
+            emit_prog, is_end = self.progress_updated.emit, self._is_sentence_end
+            neighbors, smart, chunk = self.keyboard_neighbors, self.smart_pausing, self._WRITE_CHUNK
+            write, press, sleep = pyautogui.write, pyautogui.press, time.sleep
+            tail = self._tail
 
             for bi, block in enumerate(blocks):
-                if self._stop_requested: break
+                if stopped(): break
                 self.block_updated.emit(bi+1, total_blocks)
                 self.status_message.emit(f"Block {bi+1}/{total_blocks}")
                 self.phase_changed.emit("typing")
-                chars_micro, micro_thresh = 0, random.randint(60,100)
+                chars_micro, micro_thresh = 0, randint(60,100)
                 just_ended = False
+                delays, typos = self._block_timing(len(block), chars_typed)
+                word_start = self._word_starts(block)
 
                 for ci, char in enumerate(block):
-                    if self._stop_requested: break
-                    # honour manual pause — hold here until resumed
-                    while self._pause_requested and not self._stop_requested:
-                        time.sleep(0.1)
-                    if self._stop_requested: break
-                    delay = self.get_delay(chars_typed)
-
-                    if just_ended and char not in (' ','\n','\t'):
-                        time.sleep(random.uniform(0.2, 0.6)); just_ended = False
-
-                    if char in '.!?':
-                        delay += bcd*6 + random.random()*bcd*2
-                        if self._is_sentence_end(block, ci):
-                            delay += random.uniform(0.8,1.5) if char=='?' else \
-                                     random.uniform(0.6,1.3) if char=='!' else \
-                                     random.uniform(0.5,1.0)
+                    if stopped(): break
+                    # honour manual pause — hold here until resumed (stop also wakes it)
+                    if not resumed.is_set():
+                        flush(pending, pend_d, typed)
+                        resumed.wait()
+                    if stopped(): break
+                    delay = delays[ci]
+                    o = ord(char); cls = _KEY_CLASS[o] if o < 128 else 0
+
+                    if just_ended and cls < 3:
+                        sleep(uniform(0.2, 0.6)); just_ended = False
+
+                    if cls == 2:
+                        delay += bcd*6 + rand()*bcd*2
+                        if is_end(block, ci, word_start):
+                            delay += uniform(0.8,1.5) if char=='?' else \
+                                     uniform(0.6,1.3) if char=='!' else \
+                                     uniform(0.5,1.0)
                             just_ended = True
-                    elif char in ',;:':
-                        delay += bcd*3 + random.random()*bcd
+                    elif cls == 1:
+                        delay += bcd*3 + rand()*bcd
 
-                    if self.smart_pausing and chars_micro >= micro_thresh:
-                        time.sleep(random.uniform(0.4, 2.0))
-                        chars_micro, micro_thresh = 0, random.randint(60,100)
+                    if smart and chars_micro >= micro_thresh:
+                        flush(pending, pend_d, typed)
+                        sleep(uniform(0.4, 2.0))
+                        chars_micro, micro_thresh = 0, randint(60,100)
 
                     if chars_typed in fs_triggers and fs_rem > 0:
                         fs_rem -= 1; fs_done += 1
+                        flush(pending, pend_d, typed)
                         self.phase_changed.emit("pausing")
-                        typed_content = self._perform_false_start(typed_content, bcd)
-                        if self._stop_requested: break
+                        self._perform_false_start(typed, bcd)
+                        if stopped(): break
                         self.phase_changed.emit("typing")
                         self.status_message.emit(f"Block {bi+1}/{total_blocks}")
 
                     if chars_typed in ed_triggers and ed_rem > 0:
                         ed_rem -= 1; ed_done += 1
+                        flush(pending, pend_d, typed)
                         self.phase_changed.emit("pausing")
-                        typed_content = self._perform_mistake_discovery(typed_content, bcd)
-                        if self._stop_requested: break
+                        self._perform_mistake_discovery(typed, bcd)
+                        if stopped(): break
                         self.phase_changed.emit("typing")
                         self.status_message.emit(f"Block {bi+1}/{total_blocks}")
 
-                    if random.random()*100 < self.error_rate and char not in ' \n\t':
-                        typo = random.choice(self.keyboard_neighbors.get(char.lower(),'asdf'))
-                        pyautogui.write(typo); typed_content += typo
-                        self.text_updated.emit(typed_content)
-                        time.sleep(delay*0.4 + bcd*2 + random.random()*0.1)
-                        pyautogui.press('backspace'); typed_content = typed_content[:-1]
-                        self.text_updated.emit(typed_content); time.sleep(bcd)
-
-                    pyautogui.write(char); typed_content += char
+                    if typos[ci] and cls < 3:
+                        flush(pending, pend_d, typed)
+                        typo = choice(neighbors.get(char.lower(),'asdf'))
+                        send(write, typo); typed.append(typo); tail.append(typo)
+                        emit_text(typed)
+                        sleep(delay*0.4 + bcd*2 + rand()*0.1)
+                        send(press, 'backspace'); self._pop_typed(typed)
+                        self._mark_dirty(len(typed)); emit_text(typed)
+                        sleep(bcd)
+
+                    pending.append(char); typed.append(char); tail.append(char)
                     chars_typed += 1; chars_micro += 1
-                    if chars_typed%2==0 or self.wpm<100:
-                        self.text_updated.emit(typed_content)
-                    self.progress_updated.emit(int(chars_typed/total_chars*100))
+                    if cls in (1, 2, 4):  # a perceivable pause follows — it ends the run
+                        pend_d.append(0.0); flush(pending, pend_d, typed)
+                        sleep(delay)
+                    else:
+                        pend_d.append(delay)
+                        if cls == 3 or len(pending) >= chunk:
+                            flush(pending, pend_d, typed, wait=False)
+                    emit_prog(int(chars_typed/total_chars*100))
                     if chars_typed%10==0:
                         self._emit_stats(chars_typed,total_chars,total_blocks,bi+1,fs_done,ed_done,t0)
-                    time.sleep(delay)
 
-                if bi < total_blocks-1 and not self._stop_requested:
+                flush(pending, pend_d, typed)
+
+                if bi < total_blocks-1 and not self._stop_event.is_set():
                     self.phase_changed.emit("pausing")
                     pause = self._get_block_pause(blocks[bi+1])
                     self.status_message.emit(
-                        f"Block {bi+1}/{total_blocks} done — {random.choice(self._thinking_messages)}")
+                        f"Block {bi+1}/{total_blocks} done — {choice(self._thinking_messages)}")
                     self._responsive_sleep(pause)
 
-            self.text_updated.emit(typed_content)
+            self._io_wait()
+            if self._stop_event.is_set():
+                # keys still buffered or abandoned mid-run at stop were never
+                # sent — drop them from the log
+                for _ in range(len(pending) + self._unsent): self._pop_typed(typed)
+                self._mark_dirty(len(typed))
+            self._emit_text(typed, force=True)
             self.progress_updated.emit(100)
             self._emit_stats(chars_typed,total_chars,total_blocks,total_blocks,fs_done,ed_done,t0)
             self.phase_changed.emit("complete")
@@ -429,99 +734,228 @@ class TypingWorker(QObject):
             self.status_message.emit(f"Error: {e}")
             self.phase_changed.emit("error")
         finally:
+            if self._io is not None:
+                self._io.shutdown(wait=True)  # a run in flight returns at its next key once stopped
             self.finished.emit()
 
 
+# ─────────────────────────────────────────────── stylesheets
+# fixed sheets are built once here and shared by every widget that uses them
+_MONO = "'JetBrains Mono','Consolas',monospace"
+_QSS_APP = """
+    QMainWindow, QWidget { background:#020617; color:#e2e8f0; }
+    QLabel { font-family:'Inter',-apple-system,sans-serif; font-size:13px; color:#e2e8f0; }
+    QTextEdit, QPlainTextEdit {
+        background:#0a1628; color:#f8fafc; border:1px solid #1e293b;
+        border-radius:8px; padding:14px; font-size:14px;
+        selection-background-color:#4f46e5;
+    }
+    QTextEdit:focus, QPlainTextEdit:focus { border-color:#4f46e5; }
+    QPushButton {
+        font-family:'Inter',sans-serif; font-weight:600;
+        font-size:13px; border-radius:7px; padding:9px 18px; border:none;
+    }
+    QProgressBar {
+        background:#0f172a; border-radius:3px; border:none; height:5px;
+    }
+    QProgressBar::chunk {
+        background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #6366f1,stop:1 #8b5cf6);
+        border-radius:3px;
+    }
+    QScrollBar:vertical { background:#0a1628; width:5px; margin:0; }
+    QScrollBar::handle:vertical { background:#334155; border-radius:2px; min-height:20px; }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height:0; }
+    QScrollArea { border:none; background:transparent; }
+"""
+_QSS_CHROME = "background:#0a1628; border-bottom:1px solid #1e293b;"
+_QSS_LOGO = "font-size:17px; font-weight:800; color:#fff; letter-spacing:-0.5px;"
+_QSS_BADGE = (
+    "font-size:9px; font-weight:700; color:#6366f1; background:#1e1b4b;"
+    "border-radius:4px; padding:1px 6px; margin-left:8px; letter-spacing:1px;")
+_QSS_START_BTN = (
+    "QPushButton { background:qlineargradient(x1:0,y1:0,x2:1,y2:0,"
+    "stop:0 #6366f1,stop:1 #8b5cf6); color:#fff; font-size:13px; }"
+    "QPushButton:disabled { background:#1e293b; color:#475569; }")
+_QSS_STOP_BTN = (
+    "QPushButton { background:#7f1d1d; color:#fca5a5; border:1px solid #991b1b; }"
+    "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
+_QSS_STATUS_LABEL = "font-weight:700; color:#f8fafc; font-size:14px;"
+_QSS_COUNTDOWN = (
+    "font-size:48px; font-weight:900; color:#fbbf24;"
+    f"font-family:{_MONO};")
+_QSS_STATS_BAR = "background:#0a1628; border:1px solid #1e293b; border-radius:7px;"
+_QSS_STAT_VAL = (
+    "font-size:11px;color:#f8fafc;font-weight:700;"
+    f"font-family:{_MONO};border:none;background:transparent;")
+_QSS_STAT_KEY = (
+    f"font-size:11px;color:#475569;font-family:{_MONO};"
+    "border:none;background:transparent;")
+_QSS_STAT_SEP = (
+    f"color:#1e293b;font-family:{_MONO};"
+    "border:none;background:transparent;padding:0 10px;")
+_QSS_CHAR_COUNT = "color:#334155; font-size:10px;"
+_QSS_PREVIEW = (
+    "background:#020617; border-color:#1e293b; color:#475569;"
+    f"font-family:{_MONO}; font-size:13px;")
+_QSS_PAGE_BG = "background:#020617;"
+_QSS_PAGE_TITLE = "font-size:22px; font-weight:800; color:#fff; letter-spacing:-0.3px;"
+_QSS_SAVE_BTN = (
+    "QPushButton { background:#1e293b; color:#f8fafc; border:1px solid #334155; }"
+    "QPushButton:hover { background:#334155; }")
+_QSS_HINT = "color:#475569; font-size:12px;"
+_QSS_CARD = "QFrame{background:#0a1628;border:1px solid #1e293b;border-radius:10px;}"
+_QSS_CARD_TITLE = "font-size:10px;font-weight:700;color:#6366f1;letter-spacing:1.5px;border:none;"
+_QSS_DESC = "color:#64748b; font-size:12px; border:none;"
+_QSS_TEST_BTN = (
+    "QPushButton{background:#1e293b;color:#94a3b8;border:1px solid #334155;"
+    "font-size:12px;padding:6px 14px;}"
+    "QPushButton:hover{background:#334155;color:#f8fafc;}")
+_QSS_TIP_FRAME = "QFrame{background:#111827;border:1px solid #1f2937;border-radius:8px;}"
+_QSS_TIP_WARN = "font-size:16px; color:#f59e0b; border:none;"
+_QSS_TIP_TEXT = "font-size:12px; color:#9ca3af; border:none;"
+_QSS_OLLAMA_STATUS = {
+    None:  "font-size:12px; color:#475569; border:none;",
+    True:  "font-size:12px; color:#22c55e; border:none;",
+    False: "font-size:12px; color:#ef4444; border:none;",
+}
+_QSS_OLLAMA_CHECKING = "font-size:12px; color:#fbbf24; border:none;"
+_QSS_SLIDER = """
+    QSlider::groove:horizontal {
+        height:6px; background:#1e293b; border-radius:3px; border:none;
+    }
+    QSlider::sub-page:horizontal { background:#6366f1; border-radius:3px; }
+    QSlider::handle:horizontal {
+        background:#fff; width:16px; height:16px;
+        margin:-5px 0; border-radius:8px; border:2px solid #6366f1;
+    }
+    QSlider::handle:horizontal:hover { background:#818cf8; }
+    QSlider:disabled { opacity:0.35; }
+"""
+_QSS_CHECKBOX = """
+    QCheckBox { color:#e2e8f0; font-size:13px; spacing:8px; }
+    QCheckBox::indicator {
+        width:17px; height:17px; border-radius:4px;
+        border:1px solid #475569; background:#1e293b;
+    }
+    QCheckBox::indicator:checked { background:#6366f1; border-color:#6366f1; }
+    QCheckBox:disabled { color:#475569; }
+    QCheckBox::indicator:disabled { border-color:#334155; background:#0f172a; }
+"""
+_QSS_SECTION_LABEL = "color:#64748b; font-size:10px; font-weight:700; letter-spacing:1.5px; border:none;"
+_QSS_VAL_LABEL = "color:#e2e8f0; font-size:13px; border:none;"
+_QSS_HSEP = "background:#1e293b; margin:2px 0;"
+# state-dependent looks live in one stylesheet each, picked by a dynamic property
+_QSS_PAUSE_BTN = (
+    "QPushButton { background:#1e293b; color:#f8fafc; border:1px solid #334155; }"
+    "QPushButton:hover { background:#334155; }"
+    "QPushButton[state=\"paused\"] { background:#065f46; color:#6ee7b7; border:1px solid #047857; }"
+    "QPushButton[state=\"paused\"]:hover { background:#047857; }"
+    "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
+_QSS_VAL_LABEL_DIM = (
+    "QLabel { color:#e2e8f0; font-size:13px; border:none; }"
+    "QLabel[dim=\"true\"] { color:#334155; }")
+
+
 # ─────────────────────────────────────────────── shared widget factories
+def _utf16_len(s):
+    # Qt text positions count UTF-16 units; astral characters take two
+    return len(s.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def _set_state(w, name, value):
+    # re-polish so the property selectors are re-matched; the sheet isn't reparsed
+    if w.property(name) == value: return
+    w.setProperty(name, value)
+    w.style().unpolish(w); w.style().polish(w)
+
+
 def _slider(mn, mx, default):
     s = QSlider(Qt.Orientation.Horizontal)
     s.setRange(mn, mx); s.setValue(default)
-    s.setStyleSheet("""
-        QSlider::groove:horizontal {
-            height:6px; background:#1e293b; border-radius:3px; border:none;
-        }
-        QSlider::sub-page:horizontal { background:#6366f1; border-radius:3px; }
-        QSlider::handle:horizontal {
-            background:#fff; width:16px; height:16px;
-            margin:-5px 0; border-radius:8px; border:2px solid #6366f1;
-        }
-        QSlider::handle:horizontal:hover { background:#818cf8; }
-        QSlider:disabled { opacity:0.35; }
-    """)
+    s.setStyleSheet(_QSS_SLIDER)
     return s
 
 
 def _checkbox(text, checked=True):
     cb = QCheckBox(text); cb.setChecked(checked)
-    cb.setStyleSheet("""
-        QCheckBox { color:#e2e8f0; font-size:13px; spacing:8px; }
-        QCheckBox::indicator {
-            width:17px; height:17px; border-radius:4px;
-            border:1px solid #475569; background:#1e293b;
-        }
-        QCheckBox::indicator:checked { background:#6366f1; border-color:#6366f1; }
-        QCheckBox:disabled { color:#475569; }
-        QCheckBox::indicator:disabled { border-color:#334155; background:#0f172a; }
-    """)
+    cb.setStyleSheet(_QSS_CHECKBOX)
     return cb
 
 
 def _section_label(text):
     l = QLabel(text)
-    l.setStyleSheet("color:#64748b; font-size:10px; font-weight:700; letter-spacing:1.5px; border:none;")
+    l.setStyleSheet(_QSS_SECTION_LABEL)
     return l
 
 
 def _val_label(text):
     l = QLabel(text)
-    l.setStyleSheet("color:#e2e8f0; font-size:13px; border:none;")
+    l.setStyleSheet(_QSS_VAL_LABEL)
     return l
 
 
 def _hsep():
     f = QFrame(); f.setFixedHeight(1)
-    f.setStyleSheet("background:#1e293b; margin:2px 0;")
+    f.setStyleSheet(_QSS_HSEP)
     return f
 
 
 # ─────────────────────────────────────────────── main window
 class HumanTyperApp(QMainWindow):
+    _PHASE_COLORS = {
+        "ready":"#22c55e","countdown":"#fbbf24","typing":"#6366f1",
+        "pausing":"#f97316","stopped":"#ef4444","error":"#ef4444","complete":"#22c55e",
+    }
+    # one sheet for the status dot; the phase is picked via its "dot" property
+    _QSS_STATUS_DOT = "QLabel { background:#64748b; border-radius:5px; border:none; }" + "".join(
+        f'QLabel[dot="{p}"] {{ background:{c}; }}' for p, c in _PHASE_COLORS.items())
+    # (widget attr, setter, settings key, default, slider range) — drives load,
+    # save and start, and builds the sliders in _build_settings_page
+    _SETTINGS_MAP = (
+        ("wpm_slider",                 "setValue",   "wpm",                  65,    (15, 200)),
+        ("error_slider",               "setValue",   "error_rate",           3,     (0, 20)),
+        ("var_slider",                 "setValue",   "variability",          40,    (0, 100)),
+        ("burstiness_slider",          "setValue",   "burstiness",           50,    (0, 100)),
+        ("stagger_slider",             "setValue",   "stagger",              5,     (2, 15)),
+        ("block_pause_slider",         "setValue",   "block_pause",          8,     (2, 30)),
+        ("smart_pause_checkbox",       "setChecked", "smart_pausing",        True,  None),
+        ("false_start_checkbox",       "setChecked", "false_starts_enabled", False, None),
+        ("false_start_freq_slider",    "setValue",   "false_start_count",    3,     (0, 10)),
+        ("mistake_discovery_checkbox", "setChecked", "mistake_discovery",    True,  None),
+        ("edit_freq_slider",           "setValue",   "edit_frequency",       3,     (0, 8)),
+    )
+    _SETTINGS_DEFAULTS = {k: d for _, _, k, d, _ in _SETTINGS_MAP}
+    # (slider attr, label attr, label format)
+    _SLIDER_LABELS = (
+        ("wpm_slider",              "wpm_label",              "Speed: {} WPM"),
+        ("error_slider",            "error_label",            "Error Rate: {}%"),
+        ("var_slider",              "var_label",              "Variability: {}%"),
+        ("burstiness_slider",       "burstiness_label",       "Burstiness: {}%"),
+        ("stagger_slider",          "stagger_label",          "Preparation Delay: {}s"),
+        ("block_pause_slider",      "block_pause_label",      "Block Pause: {}s"),
+        ("false_start_freq_slider", "false_start_freq_label", "False Starts: {} per session"),
+        ("edit_freq_slider",        "edit_freq_label",        "Edit Frequency: {} per session"),
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GhostWriter — Human Pattern Simulator")
         self.setMinimumSize(900, 640)
         self._ollama_available = False
+        self._ollama_check_inflight = False
+        self._last_stats = {}   # label attr -> text last shown by _on_stats
+        self._save_pool = QThreadPool(self)   # one thread, so saves land in click order
+        self._save_pool.setMaxThreadCount(1)
+        # Settings widgets are built on first visit; until then this dict is the truth
+        self._settings = dict(self._SETTINGS_DEFAULTS)
+        self._settings_built = False
         self._build_ui()
         self.load_settings()
         self._create_worker()
 
     # ══════════════════════════════════════════════ UI
     def _build_ui(self):
-        self.setStyleSheet("""
-            QMainWindow, QWidget { background:#020617; color:#e2e8f0; }
-            QLabel { font-family:'Inter',-apple-system,sans-serif; font-size:13px; color:#e2e8f0; }
-            QTextEdit {
-                background:#0a1628; color:#f8fafc; border:1px solid #1e293b;
-                border-radius:8px; padding:14px; font-size:14px;
-                selection-background-color:#4f46e5;
-            }
-            QTextEdit:focus { border-color:#4f46e5; }
-            QPushButton {
-                font-family:'Inter',sans-serif; font-weight:600;
-                font-size:13px; border-radius:7px; padding:9px 18px; border:none;
-            }
-            QProgressBar {
-                background:#0f172a; border-radius:3px; border:none; height:5px;
-            }
-            QProgressBar::chunk {
-                background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #6366f1,stop:1 #8b5cf6);
-                border-radius:3px;
-            }
-            QScrollBar:vertical { background:#0a1628; width:5px; margin:0; }
-            QScrollBar::handle:vertical { background:#334155; border-radius:2px; min-height:20px; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height:0; }
-            QScrollArea { border:none; background:transparent; }
-        """)
+        self.setStyleSheet(_QSS_APP)
 
         root = QWidget(); self.setCentralWidget(root)
         root_vbox = QVBoxLayout(root)
@@ -530,16 +964,14 @@ class HumanTyperApp(QMainWindow):
         # ── chrome bar ────────────────────────────────────────────
         chrome = QFrame()
         chrome.setFixedHeight(54)
-        chrome.setStyleSheet("background:#0a1628; border-bottom:1px solid #1e293b;")
+        chrome.setStyleSheet(_QSS_CHROME)
         ch = QHBoxLayout(chrome)
         ch.setContentsMargins(24,0,24,0); ch.setSpacing(0)
 
         logo = QLabel("GhostWriter")
-        logo.setStyleSheet("font-size:17px; font-weight:800; color:#fff; letter-spacing:-0.5px;")
+        logo.setStyleSheet(_QSS_LOGO)
         badge = QLabel("beta")
-        badge.setStyleSheet(
-            "font-size:9px; font-weight:700; color:#6366f1; background:#1e1b4b;"
-            "border-radius:4px; padding:1px 6px; margin-left:8px; letter-spacing:1px;")
+        badge.setStyleSheet(_QSS_BADGE)
         ch.addWidget(logo); ch.addWidget(badge); ch.addStretch()
 
         self._tab_btns = []
@@ -556,7 +988,8 @@ class HumanTyperApp(QMainWindow):
         # ── stacked pages ─────────────────────────────────────────
         self.stack = QStackedWidget()
         self.stack.addWidget(self._build_simulate_page())
-        self.stack.addWidget(self._build_settings_page())
+        self._settings_page = QWidget()   # placeholder, swapped for the real page on first visit
+        self.stack.addWidget(self._settings_page)
         root_vbox.addWidget(self.stack, 1)
         self._switch_tab(0)
 
@@ -569,10 +1002,13 @@ class HumanTyperApp(QMainWindow):
                 "QPushButton:hover { background:#1e293b; color:#e2e8f0; }")
 
     def _switch_tab(self, idx):
+        if idx == 1 and not self._settings_built: self._build_settings_lazily()
         self.stack.setCurrentIndex(idx)
         for i, btn in enumerate(self._tab_btns):
             btn.setChecked(i == idx)
             btn.setStyleSheet(self._tab_style(i == idx))
+        if idx == 1:
+            self.test_ollama_connection(force=False)
 
     # ── Simulate page ─────────────────────────────────────────────
     def _build_simulate_page(self):
@@ -584,38 +1020,28 @@ class HumanTyperApp(QMainWindow):
         ctrl = QHBoxLayout(); ctrl.setSpacing(10)
         self.btn_start = QPushButton("▶  START SIMULATION")
         self.btn_start.setMinimumHeight(44)
-        self.btn_start.setStyleSheet(
-            "QPushButton { background:qlineargradient(x1:0,y1:0,x2:1,y2:0,"
-            "stop:0 #6366f1,stop:1 #8b5cf6); color:#fff; font-size:13px; }"
-            "QPushButton:disabled { background:#1e293b; color:#475569; }")
+        self.btn_start.setStyleSheet(_QSS_START_BTN)
         self.btn_start.clicked.connect(self.start_typing)
 
         self.btn_stop = QPushButton("■  STOP")
         self.btn_stop.setMinimumHeight(44); self.btn_stop.setMinimumWidth(100)
         self.btn_stop.setEnabled(False)
-        self.btn_stop.setStyleSheet(
-            "QPushButton { background:#7f1d1d; color:#fca5a5; border:1px solid #991b1b; }"
-            "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
+        self.btn_stop.setStyleSheet(_QSS_STOP_BTN)
         self.btn_stop.clicked.connect(self.stop_typing)
 
         self.btn_pause = QPushButton("⏸  PAUSE")
         self.btn_pause.setMinimumHeight(44); self.btn_pause.setMinimumWidth(110)
         self.btn_pause.setEnabled(False)
-        self.btn_pause.setStyleSheet(
-            "QPushButton { background:#1e293b; color:#f8fafc; border:1px solid #334155; }"
-            "QPushButton:hover { background:#334155; }"
-            "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
+        self.btn_pause.setProperty("state", "running"); self.btn_pause.setStyleSheet(_QSS_PAUSE_BTN)
         self.btn_pause.clicked.connect(self.toggle_pause)
 
         self.status_dot = QLabel(); self.status_dot.setFixedSize(10,10)
-        self._dot_color("#22c55e")
+        self.status_dot.setProperty("dot", "ready"); self.status_dot.setStyleSheet(self._QSS_STATUS_DOT)
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("font-weight:700; color:#f8fafc; font-size:14px;")
+        self.status_label.setStyleSheet(_QSS_STATUS_LABEL)
 
         self.countdown_label = QLabel("")
-        self.countdown_label.setStyleSheet(
-            "font-size:48px; font-weight:900; color:#fbbf24;"
-            "font-family:'JetBrains Mono','Consolas',monospace;")
+        self.countdown_label.setStyleSheet(_QSS_COUNTDOWN)
         self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.countdown_label.setMinimumWidth(60)
 
@@ -633,23 +1059,16 @@ class HumanTyperApp(QMainWindow):
 
         # stats bar
         sb = QFrame(); sb.setFixedHeight(38)
-        sb.setStyleSheet("background:#0a1628; border:1px solid #1e293b; border-radius:7px;")
+        sb.setStyleSheet(_QSS_STATS_BAR)
         sh = QHBoxLayout(sb); sh.setContentsMargins(14,0,14,0); sh.setSpacing(0)
-        mono = "'JetBrains Mono','Consolas',monospace"
         def _sv(attr):
-            v = QLabel("—")
-            v.setStyleSheet(f"font-size:11px;color:#f8fafc;font-weight:700;"
-                            f"font-family:{mono};border:none;background:transparent;")
+            v = QLabel("—"); v.setStyleSheet(_QSS_STAT_VAL)
             setattr(self, attr, v); return v
         def _sk(t):
-            l = QLabel(t)
-            l.setStyleSheet(f"font-size:11px;color:#475569;font-family:{mono};"
-                            "border:none;background:transparent;")
+            l = QLabel(t); l.setStyleSheet(_QSS_STAT_KEY)
             return l
         def _ss():
-            s = QLabel("|")
-            s.setStyleSheet(f"color:#1e293b;font-family:{mono};"
-                            "border:none;background:transparent;padding:0 10px;")
+            s = QLabel("|"); s.setStyleSheet(_QSS_STAT_SEP)
             return s
         for lbl, attr in [("WPM","_sv_wpm"),("CHARS","_sv_chars"),("BLOCK","_sv_blk"),
                            ("ETA","_sv_eta"),("EDITS","_sv_edits"),("FALSE","_sv_false")]:
@@ -665,19 +1084,28 @@ class HumanTyperApp(QMainWindow):
         in_hdr = QHBoxLayout()
         in_hdr.addWidget(_section_label("SOURCE TEXT")); in_hdr.addStretch()
         self.char_count_label = QLabel("0 chars · 0 words")
-        self.char_count_label.setStyleSheet("color:#334155; font-size:10px;")
+        self.char_count_label.setStyleSheet(_QSS_CHAR_COUNT)
         in_hdr.addWidget(self.char_count_label)
         self.source_edit = QTextEdit()
         self.source_edit.setPlaceholderText("Paste the text you want GhostWriter to type…")
-        self.source_edit.textChanged.connect(self._update_char_count)
+        # recount once typing/pasting settles, not on every edit
+        self._cc_timer = QTimer(self); self._cc_timer.setSingleShot(True)
+        self._cc_timer.setInterval(150); self._cc_timer.timeout.connect(self._do_update_char_count)
+        self.source_edit.textChanged.connect(self._cc_timer.start)
         in_v.addLayout(in_hdr); in_v.addWidget(self.source_edit)
 
         out_v = QVBoxLayout(); out_v.setSpacing(5)
         out_v.addWidget(_section_label("LIVE TYPING LOG"))
-        self.preview_edit = QTextEdit(); self.preview_edit.setReadOnly(True)
-        self.preview_edit.setStyleSheet(
-            "background:#020617; border-color:#1e293b; color:#475569;"
-            "font-family:'JetBrains Mono','Consolas',monospace; font-size:13px;")
+        self.preview_edit = QPlainTextEdit(); self.preview_edit.setReadOnly(True)
+        self.preview_edit.setMaximumBlockCount(2000)   # oldest lines drop off on long runs
+        self._preview_sb = self.preview_edit.verticalScrollBar()
+        self._preview_cursor = self.preview_edit.textCursor()   # writes go through this one cursor
+        self._preview_len = 0   # length of the typed text the preview mirrors
+        # worker updates are merged here and applied at most every 33ms
+        self._pending_preview = None   # [start, text] not yet applied
+        self._preview_timer = QTimer(self); self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(33); self._preview_timer.timeout.connect(self._flush_preview)
+        self.preview_edit.setStyleSheet(_QSS_PREVIEW)
         out_v.addWidget(self.preview_edit)
 
         panels.addLayout(in_v, 1); panels.addLayout(out_v, 1)
@@ -685,6 +1113,13 @@ class HumanTyperApp(QMainWindow):
         return page
 
     # ── Settings page ─────────────────────────────────────────────
+    def _build_settings_lazily(self):
+        page = self._build_settings_page()
+        self.stack.removeWidget(self._settings_page); self._settings_page.deleteLater()
+        self.stack.insertWidget(1, page); self._settings_page = page
+        self._settings_built = True
+        self._apply_settings()
+
     def _build_settings_page(self):
         page = QWidget()
         outer = QVBoxLayout(page); outer.setContentsMargins(0,0,0,0); outer.setSpacing(0)
@@ -692,58 +1127,58 @@ class HumanTyperApp(QMainWindow):
         scroll = QScrollArea(); scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
-        inner = QWidget(); inner.setStyleSheet("background:#020617;")
+        inner = QWidget(); inner.setStyleSheet(_QSS_PAGE_BG)
         vbox = QVBoxLayout(inner)
         vbox.setContentsMargins(40, 30, 40, 40); vbox.setSpacing(0)
 
         # title row
         tr = QHBoxLayout()
         pg_title = QLabel("Settings")
-        pg_title.setStyleSheet("font-size:22px; font-weight:800; color:#fff; letter-spacing:-0.3px;")
+        pg_title.setStyleSheet(_QSS_PAGE_TITLE)
         self.btn_save = QPushButton("Save Configuration")
-        self.btn_save.setStyleSheet(
-            "QPushButton { background:#1e293b; color:#f8fafc; border:1px solid #334155; }"
-            "QPushButton:hover { background:#334155; }")
+        self.btn_save.setStyleSheet(_QSS_SAVE_BTN)
         self.btn_save.clicked.connect(self.save_settings)
         tr.addWidget(pg_title); tr.addStretch(); tr.addWidget(self.btn_save)
         vbox.addLayout(tr); vbox.addSpacing(6)
 
         hint = QLabel("Changes take effect on the next simulation run.")
-        hint.setStyleSheet("color:#475569; font-size:12px;")
+        hint.setStyleSheet(_QSS_HINT)
         vbox.addWidget(hint); vbox.addSpacing(26)
 
         def _card(title_text):
             card = QFrame()
-            card.setStyleSheet(
-                "QFrame{background:#0a1628;border:1px solid #1e293b;border-radius:10px;}")
+            card.setStyleSheet(_QSS_CARD)
             cv = QVBoxLayout(card); cv.setContentsMargins(24,18,24,18); cv.setSpacing(12)
             t = QLabel(title_text)
-            t.setStyleSheet("font-size:10px;font-weight:700;color:#6366f1;"
-                            "letter-spacing:1.5px;border:none;")
+            t.setStyleSheet(_QSS_CARD_TITLE)
             cv.addWidget(t); cv.addWidget(_hsep())
             return card, cv
 
-        def _row(layout, lattr, ltext, sattr, mn, mx, default, tip=""):
-            lbl = _val_label(ltext); sl = _slider(mn, mx, default)
+        spec = {a: (d, r) for a, _, _, d, r in self._SETTINGS_MAP}
+        labels = {sa: (la, fmt) for sa, la, fmt in self._SLIDER_LABELS}
+
+        def _mk(sattr):
+            default, (mn, mx) = spec[sattr]
+            return _slider(mn, mx, default)
+
+        def _row(layout, sattr, tip=""):
+            lattr, fmt = labels[sattr]
+            lbl = _val_label(fmt.format(spec[sattr][0])); sl = _mk(sattr)
             if tip: sl.setToolTip(tip)
             layout.addWidget(lbl); layout.addWidget(sl)
             setattr(self, lattr, lbl); setattr(self, sattr, sl)
 
         # ── Typing Behavior ───────────────────────────────────────
         c1, c1v = _card("TYPING BEHAVIOR")
-        _row(c1v,"wpm_label","Speed: 65 WPM","wpm_slider",15,200,65,"Target words per minute")
-        _row(c1v,"error_label","Error Rate: 3%","error_slider",0,20,3,
-             "Chance of hitting a neighbour key then correcting")
-        _row(c1v,"var_label","Variability: 40%","var_slider",0,100,40,
-             "Random timing jitter — higher feels more human")
-        _row(c1v,"burstiness_label","Burstiness: 50%","burstiness_slider",0,100,50,
-             "Rhythmic speed swings: bursts of momentum vs. hesitation")
+        _row(c1v,"wpm_slider","Target words per minute")
+        _row(c1v,"error_slider","Chance of hitting a neighbour key then correcting")
+        _row(c1v,"var_slider","Random timing jitter — higher feels more human")
+        _row(c1v,"burstiness_slider","Rhythmic speed swings: bursts of momentum vs. hesitation")
         vbox.addWidget(c1); vbox.addSpacing(14)
 
         # ── Timing ────────────────────────────────────────────────
         c2, c2v = _card("TIMING")
-        _row(c2v,"stagger_label","Preparation Delay: 5s","stagger_slider",2,15,5,
-             "Countdown before typing — switch to target window during this time")
+        _row(c2v,"stagger_slider","Countdown before typing — switch to target window during this time")
 
         self.smart_pause_checkbox = _checkbox("Smart Pausing", True)
         self.smart_pause_checkbox.setToolTip(
@@ -751,10 +1186,13 @@ class HumanTyperApp(QMainWindow):
         self.smart_pause_checkbox.toggled.connect(self._on_smart_pause_toggled)
         c2v.addWidget(self.smart_pause_checkbox)
 
-        self.block_pause_label = _val_label("Block Pause: 8s  (overridden by Smart Pausing)")
-        self.block_pause_label.setStyleSheet("color:#334155; font-size:13px; border:none;")
+        self.block_pause_label = _val_label(
+            labels["block_pause_slider"][1].format(spec["block_pause_slider"][0])
+            + "  (overridden by Smart Pausing)")
+        self.block_pause_label.setProperty("dim", True)
+        self.block_pause_label.setStyleSheet(_QSS_VAL_LABEL_DIM)
         self.block_pause_label.setWordWrap(True)
-        self.block_pause_slider = _slider(2, 30, 8)
+        self.block_pause_slider = _mk("block_pause_slider")
         self.block_pause_slider.setEnabled(False)
         c2v.addWidget(self.block_pause_label); c2v.addWidget(self.block_pause_slider)
         vbox.addWidget(c2); vbox.addSpacing(14)
@@ -764,18 +1202,16 @@ class HumanTyperApp(QMainWindow):
         self.mistake_discovery_checkbox = _checkbox("Simulate Mistake Discovery", True)
         self.mistake_discovery_checkbox.setToolTip(
             "Occasionally navigate back and fix word choices or spelling")
-        self.mistake_discovery_checkbox.toggled.connect(
-            lambda c: self.edit_freq_slider.setEnabled(c))
         c3v.addWidget(self.mistake_discovery_checkbox)
-        _row(c3v,"edit_freq_label","Edit Frequency: 3 per session","edit_freq_slider",0,8,3,
-             "How many times per session to go back and fix a word")
+        _row(c3v,"edit_freq_slider","How many times per session to go back and fix a word")
+        self.mistake_discovery_checkbox.toggled.connect(self.edit_freq_slider.setEnabled)
         vbox.addWidget(c3); vbox.addSpacing(14)
 
         # ── AI False Starts ───────────────────────────────────────
         c4, c4v = _card("AI FALSE STARTS  (requires Ollama)")
         desc = QLabel("Inserts AI-generated sentence fragments that get deleted and retyped, "
                       "mimicking second-guessing. Needs a local Ollama instance.")
-        desc.setStyleSheet("color:#64748b; font-size:12px; border:none;")
+        desc.setStyleSheet(_QSS_DESC)
         desc.setWordWrap(True); c4v.addWidget(desc)
 
         self.false_start_checkbox = _checkbox("Enable AI False Starts", False)
@@ -783,42 +1219,42 @@ class HumanTyperApp(QMainWindow):
         self.false_start_checkbox.toggled.connect(self._on_false_start_toggled)
         c4v.addWidget(self.false_start_checkbox)
 
-        _row(c4v,"false_start_freq_label","False Starts: 3 per session",
-             "false_start_freq_slider",0,10,3,"How many false starts to insert per session")
+        _row(c4v,"false_start_freq_slider","How many false starts to insert per session")
         self.false_start_freq_slider.setEnabled(False)
 
         or_ = QHBoxLayout(); or_.setSpacing(10)
         self.ollama_status_label = QLabel("● Ollama: Not checked")
-        self.ollama_status_label.setStyleSheet("font-size:12px; color:#475569; border:none;")
+        self.ollama_status_label.setStyleSheet(_QSS_OLLAMA_STATUS[None])
         self.btn_test_ollama = QPushButton("Test Connection")
-        self.btn_test_ollama.setStyleSheet(
-            "QPushButton{background:#1e293b;color:#94a3b8;border:1px solid #334155;"
-            "font-size:12px;padding:6px 14px;}"
-            "QPushButton:hover{background:#334155;color:#f8fafc;}")
-        self.btn_test_ollama.clicked.connect(self.test_ollama_connection)
+        self.btn_test_ollama.setStyleSheet(_QSS_TEST_BTN)
+        self.btn_test_ollama.clicked.connect(lambda: self.test_ollama_connection(force=True))
         or_.addWidget(self.ollama_status_label, 1); or_.addWidget(self.btn_test_ollama)
         c4v.addLayout(or_)
         vbox.addWidget(c4); vbox.addSpacing(14)
 
         # ── safety tip ────────────────────────────────────────────
         tip = QFrame()
-        tip.setStyleSheet("QFrame{background:#111827;border:1px solid #1f2937;border-radius:8px;}")
+        tip.setStyleSheet(_QSS_TIP_FRAME)
         th = QHBoxLayout(tip); th.setContentsMargins(16,12,16,12); th.setSpacing(10)
-        warn = QLabel("⚠"); warn.setStyleSheet("font-size:16px; color:#f59e0b; border:none;")
+        warn = QLabel("⚠"); warn.setStyleSheet(_QSS_TIP_WARN)
         tip_text = QLabel(
             "<b style='color:#f59e0b'>Safety tip</b> — "
             "Move your mouse into any screen corner to stop typing immediately "
             "(PyAutoGUI fail-safe).")
-        tip_text.setStyleSheet("font-size:12px; color:#9ca3af; border:none;")
+        tip_text.setStyleSheet(_QSS_TIP_TEXT)
         tip_text.setWordWrap(True)
         th.addWidget(warn, 0, Qt.AlignmentFlag.AlignTop); th.addWidget(tip_text, 1)
         vbox.addWidget(tip); vbox.addStretch()
 
-        # wire sliders
-        for s in (self.wpm_slider, self.error_slider, self.var_slider, self.burstiness_slider,
-                  self.stagger_slider, self.block_pause_slider,
-                  self.false_start_freq_slider, self.edit_freq_slider):
-            s.valueChanged.connect(self.update_labels)
+        # wire sliders — each only touches its own label, at most every 50ms while
+        # dragging; release shows the final value
+        self._label_pending = {}   # label -> (format, value) not yet shown
+        self._label_timer = QTimer(self); self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(50); self._label_timer.timeout.connect(self._flush_labels)
+        for sattr, lattr, fmt in self._SLIDER_LABELS:
+            s = getattr(self, sattr)
+            s.valueChanged.connect(functools.partial(self._queue_label, getattr(self, lattr), fmt))
+            s.sliderReleased.connect(self._flush_labels)
 
         scroll.setWidget(inner); outer.addWidget(scroll)
         return page
@@ -828,130 +1264,157 @@ class HumanTyperApp(QMainWindow):
         self.thread = QThread()
         self.worker = TypingWorker()
         self.worker.moveToThread(self.thread)
-        self.worker.text_updated.connect(self.update_output_preview)
+        self.worker.text_updated.connect(self._queue_preview)
+        self.worker.text_appended.connect(self._queue_preview_append)
         self.worker.progress_updated.connect(self.progress_bar.setValue)
-        self.worker.countdown_updated.connect(lambda v: self.countdown_label.setText(str(v) if v else ""))
-        self.worker.status_message.connect(lambda m: self.status_label.setText(m))
+        self.worker.countdown_updated.connect(self._on_countdown)
+        self.worker.status_message.connect(self.status_label.setText)
         self.worker.phase_changed.connect(self._on_phase)
-        self.worker.block_updated.connect(lambda c, t: self.status_label.setText(f"Block {c} / {t}"))
+        self.worker.block_updated.connect(self._on_block)
         self.worker.stats_updated.connect(self._on_stats)
         self.worker.finished.connect(self.on_typing_finished)
-        self.thread.started.connect(self.worker.run)
 
-    def _dot_color(self, c):
-        self.status_dot.setStyleSheet(f"background:{c}; border-radius:5px; border:none;")
+    def _on_countdown(self, v):
+        self.countdown_label.setText(str(v) if v else "")
+
+    def _on_block(self, c, t):
+        self.status_label.setText(f"Block {c} / {t}")
+
+    def _dot_color(self, phase):
+        _set_state(self.status_dot, "dot", phase)
 
     def _on_phase(self, phase):
-        self._dot_color({
-            "ready":"#22c55e","countdown":"#fbbf24","typing":"#6366f1",
-            "pausing":"#f97316","stopped":"#ef4444","error":"#ef4444","complete":"#22c55e",
-        }.get(phase, "#64748b"))
+        self._dot_color(phase)
 
     def _on_stats(self, s):
-        self._sv_wpm.setText(str(s.get("actual_wpm", 0)))
-        self._sv_chars.setText(f"{s.get('chars_typed',0)}/{s.get('total_chars',0)}")
-        self._sv_blk.setText(f"{s.get('blocks_done',0)}/{s.get('total_blocks',0)}")
-        eta = s.get("eta_seconds", 0)
-        self._sv_eta.setText(f"{eta//60}m {eta%60}s" if eta>=60 else f"{eta}s")
-        self._sv_edits.setText(str(s.get("corrections", 0)))
-        self._sv_false.setText(str(s.get("false_starts", 0)))
-
-    def _update_char_count(self):
+        m, sec = divmod(s.get("eta_seconds", 0), 60)
+        last = self._last_stats
+        for a, t in (
+            ("_sv_wpm",   str(s.get("actual_wpm", 0))),
+            ("_sv_chars", f"{s.get('chars_typed',0)}/{s.get('total_chars',0)}"),
+            ("_sv_blk",   f"{s.get('blocks_done',0)}/{s.get('total_blocks',0)}"),
+            ("_sv_eta",   f"{m}m {sec}s" if m else f"{sec}s"),
+            ("_sv_edits", str(s.get("corrections", 0))),
+            ("_sv_false", str(s.get("false_starts", 0))),
+        ):
+            if last.get(a) != t:   # identical text would still invalidate the label
+                getattr(self, a).setText(t); last[a] = t
+
+    def _do_update_char_count(self):
         t = self.source_edit.toPlainText()
-        w = len(t.split()) if t.strip() else 0
-        self.char_count_label.setText(f"{len(t):,} chars · {w:,} words")
+        n = len(t)   # code points, as the worker counts them — not UTF-16 units
+        w = sum(1 for _ in _WORD_RE.finditer(t)) if n else 0   # no word list
+        self.char_count_label.setText(f"{n:,} chars · {w:,} words")
 
     def _on_smart_pause_toggled(self, checked):
         self.block_pause_slider.setEnabled(not checked)
         if checked:
             self.block_pause_label.setText("Block Pause: (overridden by Smart Pausing)")
-            self.block_pause_label.setStyleSheet("color:#334155; font-size:13px; border:none;")
         else:
             self.block_pause_label.setText(f"Block Pause: {self.block_pause_slider.value()}s")
-            self.block_pause_label.setStyleSheet("color:#e2e8f0; font-size:13px; border:none;")
+        _set_state(self.block_pause_label, "dim", checked)
 
     def _on_false_start_toggled(self, checked):
         self.false_start_freq_slider.setEnabled(checked and self._ollama_available)
 
+    def _queue_label(self, label, fmt, value):
+        self._label_pending[label] = (fmt, value)
+        if not self._label_timer.isActive(): self._label_timer.start()
+
+    def _flush_labels(self):
+        self._label_timer.stop()
+        pending, self._label_pending = self._label_pending, {}
+        for label, (fmt, value) in pending.items():
+            # Smart Pausing owns the block-pause label text while it is on
+            if label is self.block_pause_label and self.smart_pause_checkbox.isChecked(): continue
+            label.setText(fmt.format(value))
+
     def update_labels(self):
-        self.wpm_label.setText(f"Speed: {self.wpm_slider.value()} WPM")
-        self.error_label.setText(f"Error Rate: {self.error_slider.value()}%")
-        self.var_label.setText(f"Variability: {self.var_slider.value()}%")
-        self.burstiness_label.setText(f"Burstiness: {self.burstiness_slider.value()}%")
-        self.stagger_label.setText(f"Preparation Delay: {self.stagger_slider.value()}s")
-        self.false_start_freq_label.setText(
-            f"False Starts: {self.false_start_freq_slider.value()} per session")
-        self.edit_freq_label.setText(
-            f"Edit Frequency: {self.edit_freq_slider.value()} per session")
-        if not self.smart_pause_checkbox.isChecked():
-            self.block_pause_label.setText(f"Block Pause: {self.block_pause_slider.value()}s")
+        self._label_pending = {
+            getattr(self, lattr): (fmt, getattr(self, sattr).value())
+            for sattr, lattr, fmt in self._SLIDER_LABELS}
+        self._flush_labels()
 
     # ══════════════════════════════════════════════ Ollama
-    def test_ollama_connection(self):
+    def test_ollama_connection(self, force=True):
+        # fresh probe on explicit "Test Connection"; opening Settings reuses the cache
+        if self._ollama_check_inflight: return
+        self._ollama_check_inflight = True
         self.btn_test_ollama.setEnabled(False)
         self.ollama_status_label.setText("● Ollama: Checking…")
-        self.ollama_status_label.setStyleSheet("font-size:12px; color:#fbbf24; border:none;")
-        self._ol_thread = QThread(); self._ol_worker = OllamaCheckWorker()
-        self._ol_worker.moveToThread(self._ol_thread)
-        self._ol_worker.result.connect(self._on_ollama_result)
-        self._ol_worker.finished.connect(self._ol_thread.quit)
-        self._ol_thread.started.connect(self._ol_worker.run)
-        self._ol_thread.start()
+        self.ollama_status_label.setStyleSheet(_QSS_OLLAMA_CHECKING)
+        QThreadPool.globalInstance().start(OllamaCheckTask(self, force))
 
+    @pyqtSlot(bool, str)
     def _on_ollama_result(self, ok, msg):
+        self._ollama_check_inflight = False
         self._ollama_available = ok
         self.btn_test_ollama.setEnabled(True)
-        color = "#22c55e" if ok else "#ef4444"
         self.ollama_status_label.setText(f"● Ollama: {msg}")
-        self.ollama_status_label.setStyleSheet(f"font-size:12px; color:{color}; border:none;")
+        self.ollama_status_label.setStyleSheet(_QSS_OLLAMA_STATUS[ok])
         self.false_start_checkbox.setEnabled(ok)
         if not ok:
-            self.false_start_checkbox.setChecked(False)
+            b = QSignalBlocker(self.false_start_checkbox)   # the slider is handled right here
+            self.false_start_checkbox.setChecked(False); b.unblock()
             self.false_start_freq_slider.setEnabled(False)
         else:
             self.false_start_freq_slider.setEnabled(self.false_start_checkbox.isChecked())
 
     # ══════════════════════════════════════════════ persistence
     def save_settings(self):
-        try:
-            with open(SETTINGS_FILE, "w") as f:
-                json.dump({
-                    "wpm":                  self.wpm_slider.value(),
-                    "error_rate":           self.error_slider.value(),
-                    "variability":          self.var_slider.value(),
-                    "burstiness":           self.burstiness_slider.value(),
-                    "stagger":              self.stagger_slider.value(),
-                    "block_pause":          self.block_pause_slider.value(),
-                    "smart_pausing":        self.smart_pause_checkbox.isChecked(),
-                    "false_starts_enabled": self.false_start_checkbox.isChecked(),
-                    "false_start_count":    self.false_start_freq_slider.value(),
-                    "mistake_discovery":    self.mistake_discovery_checkbox.isChecked(),
-                    "edit_frequency":       self.edit_freq_slider.value(),
-                }, f)
-            self.btn_save.setText("✓  Saved")
-            QTimer.singleShot(2200, lambda: self.btn_save.setText("Save Configuration"))
-        except Exception:
-            pass
+        # values are read here; the disk write runs on the save pool
+        self._save_pool.start(SettingsSaveTask(self._current_settings(), self))
+
+    @pyqtSlot()
+    def _on_save_done(self):
+        self.btn_save.setText("✓  Saved")
+        QTimer.singleShot(2200, lambda: self.btn_save.setText("Save Configuration"))
+
+    def _current_settings(self):
+        if not self._settings_built: return dict(self._settings)
+        d = {}
+        for attr, setter, key, *_ in self._SETTINGS_MAP:
+            w = getattr(self, attr)
+            d[key] = w.value() if setter == "setValue" else w.isChecked()
+        return d
 
     def load_settings(self):
         if not os.path.exists(SETTINGS_FILE): return
         try:
             with open(SETTINGS_FILE) as f: d = json.load(f)
-            self.wpm_slider.setValue(d.get("wpm", 65))
-            self.error_slider.setValue(d.get("error_rate", 3))
-            self.var_slider.setValue(d.get("variability", 40))
-            self.burstiness_slider.setValue(d.get("burstiness", 50))
-            self.stagger_slider.setValue(d.get("stagger", 5))
-            self.block_pause_slider.setValue(d.get("block_pause", 8))
-            self.smart_pause_checkbox.setChecked(d.get("smart_pausing", True))
-            self.false_start_checkbox.setChecked(d.get("false_starts_enabled", False))
-            self.false_start_freq_slider.setValue(d.get("false_start_count", 3))
-            self.mistake_discovery_checkbox.setChecked(d.get("mistake_discovery", True))
-            self.edit_freq_slider.setValue(d.get("edit_frequency", 3))
-            self.update_labels()
-            self._on_smart_pause_toggled(self.smart_pause_checkbox.isChecked())
+            if not isinstance(d, dict): return
+        except Exception:
+            return
+        # same checks the widgets would apply: sliders take ints clamped to their
+        # range, checkboxes take bools; anything else falls back to the default
+        for _, setter, key, default, rng in self._SETTINGS_MAP:
+            v = d.get(key, default)
+            if rng is None:
+                v = v if isinstance(v, bool) else default
+            elif isinstance(v, int) and not isinstance(v, bool):
+                v = min(max(v, rng[0]), rng[1])
+            else:
+                v = default
+            self._settings[key] = v
+        if self._settings_built: self._apply_settings()
+
+    def _apply_settings(self):
+        d = self._settings
+        widgets = [(getattr(self, attr), setter, key, default)
+                   for attr, setter, key, default, _ in self._SETTINGS_MAP]
+        # silence the widgets while loading, then refresh labels/dependents once
+        blockers = [QSignalBlocker(w) for w, *_ in widgets]
+        try:
+            for w, setter, key, default in widgets:
+                getattr(w, setter)(d.get(key, default))
         except Exception:
             pass
+        finally:
+            for b in blockers: b.unblock()
+        self.update_labels()
+        self._on_smart_pause_toggled(self.smart_pause_checkbox.isChecked())
+        self._on_false_start_toggled(self.false_start_checkbox.isChecked())
+        self.edit_freq_slider.setEnabled(self.mistake_discovery_checkbox.isChecked())
 
     # ══════════════════════════════════════════════ typing control
     def start_typing(self):
@@ -960,78 +1423,121 @@ class HumanTyperApp(QMainWindow):
             self.status_label.setText("Paste some text first!"); return
         self.progress_bar.setValue(0)
         self.countdown_label.setText("")
-        self.preview_edit.clear()
+        self._preview_timer.stop(); self._pending_preview = None
+        self.preview_edit.clear(); self._preview_len = 0
+        self._preview_cursor = self.preview_edit.textCursor()
         self.status_label.setText("Ready")
-        self._dot_color("#22c55e")
+        self._dot_color("ready")
         for a in ("_sv_wpm","_sv_chars","_sv_blk","_sv_eta","_sv_edits","_sv_false"):
             getattr(self, a).setText("—")
+        self._last_stats.clear()
         self.btn_start.setEnabled(False); self.btn_stop.setEnabled(True); self.btn_pause.setEnabled(True)
 
-        self.worker.source_text               = text
-        self.worker.wpm                       = self.wpm_slider.value()
-        self.worker.error_rate                = self.error_slider.value()
-        self.worker.variability               = self.var_slider.value()
-        self.worker.burstiness                = self.burstiness_slider.value()
-        self.worker.start_delay               = self.stagger_slider.value()
-        self.worker.block_pause               = self.block_pause_slider.value()
-        self.worker.smart_pausing             = self.smart_pause_checkbox.isChecked()
-        self.worker.false_starts_enabled      = (
-            self.false_start_checkbox.isChecked() and self.false_start_checkbox.isEnabled())
-        self.worker.false_start_count         = self.false_start_freq_slider.value()
-        self.worker.mistake_discovery_enabled = self.mistake_discovery_checkbox.isChecked()
-        self.worker.edit_frequency            = self.edit_freq_slider.value()
+        s = self._current_settings()
+        cfg = {
+            "source_text":               text,
+            "wpm":                       s["wpm"],
+            "error_rate":                s["error_rate"],
+            "variability":               s["variability"],
+            "burstiness":                s["burstiness"],
+            "start_delay":               s["stagger"],
+            "block_pause":               s["block_pause"],
+            "smart_pausing":             s["smart_pausing"],
+            # the checkbox is only enabled once Ollama has answered
+            "false_starts_enabled":      s["false_starts_enabled"] and self._ollama_available,
+            "false_start_count":         s["false_start_count"],
+            "mistake_discovery_enabled": s["mistake_discovery"],
+            "edit_frequency":            s["edit_frequency"],
+        }
+        # configure and run are queued to the worker's event loop, so they run
+        # there in order: the settings are in place before run() reads them
         self.thread.start()
+        QMetaObject.invokeMethod(self.worker, "configure", Qt.ConnectionType.QueuedConnection,
+                                 Q_ARG(dict, cfg))
+        QMetaObject.invokeMethod(self.worker, "run", Qt.ConnectionType.QueuedConnection)
 
     def stop_typing(self):
         self.worker.stop()
         self.status_label.setText("Stopping…")
-        self._dot_color("#ef4444")
+        self._dot_color("stopped")
         self.btn_stop.setEnabled(False)
         self.btn_pause.setEnabled(False)
 
     def toggle_pause(self):
-        if self.worker._pause_requested:
+        if self.worker.is_paused():
             # Currently paused — resume
             self.worker.resume()
-            self.btn_pause.setText("⏸  PAUSE")
-            self.btn_pause.setStyleSheet(
-                "QPushButton { background:#1e293b; color:#f8fafc; border:1px solid #334155; }"
-                "QPushButton:hover { background:#334155; }"
-                "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
+            self.btn_pause.setText("⏸  PAUSE"); _set_state(self.btn_pause, "state", "running")
             self.status_label.setText("Resuming…")
-            self._dot_color("#6366f1")
+            self._dot_color("typing")
         else:
             # Currently typing — pause
             self.worker.pause()
-            self.btn_pause.setText("▶  RESUME")
-            self.btn_pause.setStyleSheet(
-                "QPushButton { background:#065f46; color:#6ee7b7; border:1px solid #047857; }"
-                "QPushButton:hover { background:#047857; }"
-                "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
+            self.btn_pause.setText("▶  RESUME"); _set_state(self.btn_pause, "state", "paused")
             self.status_label.setText("Paused")
-            self._dot_color("#f97316")
+            self._dot_color("pausing")
 
     def on_typing_finished(self):
+        self._flush_preview()
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.btn_pause.setEnabled(False)
-        self.btn_pause.setText("⏸  PAUSE")
-        self.btn_pause.setStyleSheet(
-            "QPushButton { background:#1e293b; color:#f8fafc; border:1px solid #334155; }"
-            "QPushButton:hover { background:#334155; }"
-            "QPushButton:disabled { background:#1e293b; color:#475569; border:none; }")
-        self.worker._pause_requested = False
+        self.btn_pause.setText("⏸  PAUSE"); _set_state(self.btn_pause, "state", "running")
+        self.worker.resume()
         st = self.status_label.text()
         if "Stopping" in st:
-            self.status_label.setText("Stopped"); self._dot_color("#ef4444")
+            self.status_label.setText("Stopped"); self._dot_color("stopped")
         elif "Error" not in st and "Fail-safe" not in st:
-            self.status_label.setText("Complete ✓"); self._dot_color("#22c55e")
+            self.status_label.setText("Complete ✓"); self._dot_color("complete")
         self.thread.quit(); self.thread.wait()
         self._create_worker()
 
-    def update_output_preview(self, text):
-        self.preview_edit.setPlainText(text)
-        sb = self.preview_edit.verticalScrollBar(); sb.setValue(sb.maximum())
+    def _queue_preview(self, text, start):
+        p = self._pending_preview
+        if p is None or start <= p[0]:
+            self._pending_preview = [start, text]
+        else:   # the rewrite lands inside the pending text
+            p[1] = p[1][:start - p[0]] + text
+        if not self._preview_timer.isActive(): self._preview_timer.start()
+
+    def _queue_preview_append(self, delta):
+        p = self._pending_preview
+        if p is None: self._pending_preview = [self._preview_len, delta]
+        else: p[1] += delta
+        if not self._preview_timer.isActive(): self._preview_timer.start()
+
+    def _flush_preview(self):
+        self._preview_timer.stop()
+        p, self._pending_preview = self._pending_preview, None
+        if p is None: return
+        if p[0] == self._preview_len: self.update_output_preview_append(p[1])
+        else: self.update_output_preview(p[1], p[0])
+
+    def update_output_preview(self, text, start):
+        # replace everything from `start` on; counted back from the end since
+        # the block limit may have trimmed the head of the document
+        sb, cur = self._preview_sb, self._preview_cursor
+        at_end = sb.value() == sb.maximum()
+        cur.movePosition(QTextCursor.MoveOperation.End)
+        end, n = cur.position(), self._preview_len - start   # n code points to replace
+        span = 0
+        if n > 0:
+            # cursor positions are UTF-16 units: read back at most 2n units (enough
+            # for n code points) and measure the last n of them
+            cur.setPosition(max(0, end - 2*n), QTextCursor.MoveMode.KeepAnchor)
+            span = _utf16_len(cur.selectedText()[-n:])
+        cur.setPosition(max(0, end - span))
+        cur.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cur.removeSelectedText(); cur.insertText(text)
+        self._preview_len = start + len(text)
+        if at_end: sb.setValue(sb.maximum())
+
+    def update_output_preview_append(self, delta):
+        sb, cur = self._preview_sb, self._preview_cursor
+        at_end = sb.value() == sb.maximum()
+        cur.movePosition(QTextCursor.MoveOperation.End); cur.insertText(delta)
+        self._preview_len += len(delta)
+        if at_end: sb.setValue(sb.maximum())
 
 
 # ─────────────────────────────────────────────── entry point